@@ -0,0 +1,36 @@
+# cython: language_level=3
+"""
+C-реализация арифметического ядра расчета стоимости поездки.
+
+Сборка:
+    python setup.py build_ext --inplace
+
+Если расширение не собрано, taxi_calculator использует версию ядра
+на чистом Python.
+"""
+
+
+from libc.math cimport floor
+
+
+cpdef double fare_kernel(double distance, double rate_kop, double mult,
+                         double min_kop) nogil:
+    """
+    Рассчитывает стоимость поездки в копейках.
+    
+    Округление выполняется в double, а не приведением к long long:
+    для очень больших расстояний стоимость не помещается в int64.
+    
+    Args:
+        distance: Расстояние поездки в км
+        rate_kop: Ставка тарифа (коп/км)
+        mult: Общий коэффициент пробок, непогоды и спроса
+        min_kop: Минимальная стоимость поездки в копейках
+    
+    Returns:
+        float: Стоимость поездки в копейках (целое значение), не меньше min_kop
+    """
+    cdef double kop = floor(distance * rate_kop * mult + 0.5)
+    if kop < min_kop:
+        kop = min_kop
+    return kop
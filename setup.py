@@ -0,0 +1,30 @@
+"""
+Сборка C-расширения ядра расчета стоимости (необязательно).
+
+Без Cython устанавливается только модуль taxi_calculator.
+
+Использование:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # без Cython ставится только чистый Python-модуль
+    ext_modules = []
+else:
+    ext_modules = cythonize([
+        Extension(
+            '_fare_kernel',
+            ['_fare_kernel.pyx'],
+            extra_compile_args=['-O3'],
+        ),
+    ])
+
+setup(
+    name='taxi_calculator',
+    py_modules=['taxi_calculator'],
+    ext_modules=ext_modules,
+)
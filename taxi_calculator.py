@@ -10,6 +10,139 @@
     print(f"Стоимость: {fare} руб")
 """
 
+import functools
+import math
+import sys
+import types
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy нужен только для пакетного расчета
+    np = None
+
+
+def _combined_multipliers(traffic, weather, overload):
+    """
+    Строит таблицу произведений коэффициентов для всех сочетаний рейтингов.
+    
+    Returns:
+        tuple: Вложенный кортеж 5×5×5, элемент [t-1][w-1][o-1] которого
+            равен traffic[t] * weather[w] * overload[o]
+    """
+    ratings = range(1, 6)
+    return tuple(
+        tuple(
+            tuple(traffic[t] * weather[w] * overload[o] for o in ratings)
+            for w in ratings
+        )
+        for t in ratings
+    )
+
+
+def _fare_kernel(distance, rate_kop, mult, min_kop):
+    """
+    Арифметическое ядро расчета стоимости поездки в копейках.
+    
+    Не компилируется numba: вызов скомпилированной функции из Python
+    дороже самих трех умножений. Если собрано C-расширение _fare_kernel,
+    заменяется им (оно возвращает float с целым значением). Параметры
+    должны быть уже проверены вызывающим кодом. Половина копейки
+    округляется вверх.
+    
+    Args:
+        distance: Расстояние поездки в км
+        rate_kop: Ставка тарифа (коп/км)
+        mult: Общий коэффициент пробок, непогоды и спроса
+        min_kop: Минимальная стоимость поездки в копейках
+    
+    Returns:
+        int: Стоимость поездки в копейках
+    """
+    kop = int(distance * rate_kop * mult + 0.5)
+    return kop if kop > min_kop else min_kop
+
+
+try:
+    # Собранное C-расширение не требует JIT-прогрева, поэтому имеет приоритет
+    from _fare_kernel import fare_kernel as _fare_kernel
+except ImportError:  # pragma: no cover - расширение собирается отдельно (setup.py)
+    pass
+
+
+# Начиная с этого числа поездок пакетный расчет распределяется по потокам;
+# для меньших массивов запуск потоков дороже самого расчета
+_PARALLEL_MIN_SIZE = 2000
+
+@functools.lru_cache(maxsize=None)
+def _batch_kernels():
+    """
+    Возвращает ядра пакетного расчета стоимости в копейках.
+    
+    numba импортируется, а ядра компилируются (или загружаются из кэша)
+    при первом пакетном расчете: импорт модуля и поштучный расчет
+    не тратят на это время.
+    
+    Returns:
+        tuple: (ufunc расчета, многопоточное ядро для одномерных массивов
+            или None, если numba не установлена)
+    """
+    try:
+        from numba import njit, prange, vectorize
+    except ImportError:  # pragma: no cover - без numba используются операции numpy
+        def fare_ufunc(distance, rate_kop, mult, min_kop):
+            """Расчет стоимости в копейках над массивами numpy."""
+            return np.maximum(np.floor(distance * rate_kop * mult + 0.5), min_kop)
+        
+        return fare_ufunc, None
+    
+    # float32 указан первым: numpy выбирает первый цикл, к типам которого
+    # безопасно приводятся аргументы, и иначе float32 считался бы в float64
+    @vectorize(['float32(float32, float32, float32, float32)',
+                'float64(float64, float64, float64, float64)'],
+               cache=True)
+    def fare_ufunc(distance, rate_kop, mult, min_kop):
+        """
+        Ufunc расчета стоимости в копейках для пакетного расчета.
+        
+        Выполняет те же операции, что и _fare_kernel, поэтому в float64
+        результаты пакетного и поштучного расчета совпадают. Деления в ядре
+        нет, чтобы numba могла векторизовать цикл.
+        """
+        kop = np.floor(distance * rate_kop * mult + 0.5)
+        return kop if kop > min_kop else min_kop
+    
+    @njit(parallel=True, cache=True)
+    def fare_batch_parallel(distance, rate_kop, mult, min_kop, out):
+        """
+        Многопоточный расчет стоимости в копейках для больших массивов.
+        
+        Операции те же, что в fare_ufunc; массивы должны быть одномерными
+        и одной длины, результат записывается в out.
+        """
+        for i in prange(distance.shape[0]):
+            kop = np.floor(distance[i] * rate_kop[i] * mult[i] + 0.5)
+            out[i] = kop if kop > min_kop else min_kop
+    
+    return fare_ufunc, fare_batch_parallel
+
+
+# Исходный код функции расчета для одного тарифа (см. TaxiCalculator.get_pricer).
+# Ставка и минимальная стоимость подставляются в код как константы; название
+# тарифа передается через пространство имен и в текст кода не попадает.
+_PRICER_TEMPLATE = """
+def pricer(distance, traffic_rating=1, weather_rating=1, overload_rating=1):
+    if not ((type(distance) is int or type(distance) is float)
+            and 0 < distance < inf
+            and type(traffic_rating) is int and 1 <= traffic_rating <= 5
+            and type(weather_rating) is int and 1 <= weather_rating <= 5
+            and type(overload_rating) is int and 1 <= overload_rating <= 5):
+        validate(distance, tariff, traffic_rating, weather_rating, overload_rating)
+    kop = int(distance * {rate_kop!r}
+              * combined[traffic_rating - 1][weather_rating - 1][overload_rating - 1]
+              + 0.5)
+    return (kop if kop > {min_kop!r} else {min_kop!r}) / 100
+"""
+
 
 class TaxiCalculator:
     """
@@ -27,47 +160,97 @@ class TaxiCalculator:
     - Уровень спроса (1-5): 1.0 - 2.0
     """
     
-    # Базовые ставки по типам тарифов (руб/км)
+    # Все данные калькулятора — константы класса, состояния экземпляра нет
+    __slots__ = ()
+    
+    # Базовые ставки по типам тарифов (руб/км). Названия тарифов
+    # интернируются: если вызывающий код тоже передает интернированные
+    # строки (sys.intern или названия из get_tariff_info), поиск тарифа
+    # в словарях сводится к сравнению указателей
     TARIFF_RATES = {
-        'эконом': 100,
-        'комфорт': 150,
-        'комфорт_плюс': 200,
-        'бизнес': 300
+        sys.intern('эконом'): 100,
+        sys.intern('комфорт'): 150,
+        sys.intern('комфорт_плюс'): 200,
+        sys.intern('бизнес'): 300
     }
     
+    # Названия тарифов в порядке объявления
+    _TARIFF_NAMES = tuple(TARIFF_RATES)
+    
     # Минимальная стоимость поездки (руб)
     MIN_FARE = 50
     
-    # Коэффициенты за влияние факторов
-    TRAFFIC_MULTIPLIERS = {
-        1: 1.0,      # Нет пробок
-        2: 1.1,      # Легкие пробки
-        3: 1.25,     # Средние пробки
-        4: 1.5,      # Большие пробки
-        5: 2.0       # Очень большие пробки
-    }
+    # Ставки и минимальная стоимость в копейках для целочисленного расчета
+    _TARIFF_RATES_KOP = {tariff: rate * 100 for tariff, rate in TARIFF_RATES.items()}
+    _MIN_FARE_KOP = MIN_FARE * 100
     
-    WEATHER_MULTIPLIERS = {
-        1: 1.0,      # Хорошая погода
-        2: 1.05,     # Облачно
-        3: 1.15,     # Дождь/снег
-        4: 1.3,      # Сильный дождь/метель
-        5: 1.5       # Сильный шторм/ледяной дождь
-    }
+    # Коэффициенты за влияние факторов, индексируемые рейтингом 1-5
+    # (элемент 0 не используется)
+    TRAFFIC_MULTIPLIERS = (
+        0.0,
+        1.0,     # 1: Нет пробок
+        1.1,     # 2: Легкие пробки
+        1.25,    # 3: Средние пробки
+        1.5,     # 4: Большие пробки
+        2.0      # 5: Очень большие пробки
+    )
     
-    OVERLOAD_MULTIPLIERS = {
-        1: 1.0,      # Нет спроса
-        2: 1.1,      # Нормальный спрос
-        3: 1.25,     # Повышенный спрос
-        4: 1.5,      # Высокий спрос
-        5: 2.0       # Экстремальный спрос
-    }
+    WEATHER_MULTIPLIERS = (
+        0.0,
+        1.0,     # 1: Хорошая погода
+        1.05,    # 2: Облачно
+        1.15,    # 3: Дождь/снег
+        1.3,     # 4: Сильный дождь/метель
+        1.5      # 5: Сильный шторм/ледяной дождь
+    )
+    
+    OVERLOAD_MULTIPLIERS = (
+        0.0,
+        1.0,     # 1: Нет спроса
+        1.1,     # 2: Нормальный спрос
+        1.25,    # 3: Повышенный спрос
+        1.5,     # 4: Высокий спрос
+        2.0      # 5: Экстремальный спрос
+    )
+    
+    # Общий коэффициент для каждого сочетания рейтингов:
+    # _COMBINED[traffic - 1][weather - 1][overload - 1]
+    _COMBINED = _combined_multipliers(
+        TRAFFIC_MULTIPLIERS, WEATHER_MULTIPLIERS, OVERLOAD_MULTIPLIERS
+    )
+    
+    # Информация о тарифах, возвращаемая get_tariff_info (только для чтения)
+    _TARIFF_INFO = types.MappingProxyType({
+        'тарифы': _TARIFF_NAMES,
+        'ставки': types.MappingProxyType(TARIFF_RATES),
+        'минимальная_стоимость': MIN_FARE
+    })
+    
+    # Функции расчета, сгенерированные get_pricer (тариф -> функция)
+    _PRICERS = {}
+    
+    # Коды тарифов для пакетного расчета (индексы в _TARIFF_KOP_LUT)
+    _TARIFF_CODES = {tariff: code for code, tariff in enumerate(_TARIFF_NAMES)}
+    
+    # Таблицы ставок (коп/км) и общих коэффициентов в виде массивов numpy
+    # для пакетного расчета
+    if np is not None:
+        _TARIFF_KOP_LUT = np.array(list(_TARIFF_RATES_KOP.values()), dtype=np.float64)
+        _COMBINED_LUT = np.array(_COMBINED, dtype=np.float64)
+        
+        # Таблицы для каждого поддерживаемого типа вычислений
+        _BATCH_LUTS = {
+            np.dtype(np.float64): (_TARIFF_KOP_LUT, _COMBINED_LUT),
+            np.dtype(np.float32): (_TARIFF_KOP_LUT.astype(np.float32),
+                                   _COMBINED_LUT.astype(np.float32))
+        }
     
     def __init__(self):
         """Инициализация калькулятора."""
         pass
     
-    def validate_distance(self, distance):
+    @staticmethod
+    def validate_distance(distance):
         """
         Проверяет корректность расстояния.
         
@@ -75,15 +258,18 @@ class TaxiCalculator:
             distance: Расстояние поездки в км
             
         Raises:
-            ValueError: Если расстояние <= 0
+            ValueError: Если расстояние <= 0 или не конечно (inf, nan)
             TypeError: Если расстояние не число
         """
         if not isinstance(distance, (int, float)):
             raise TypeError(f"Расстояние должно быть числом, получено: {type(distance)}")
+        if not math.isfinite(distance):
+            raise ValueError(f"Расстояние должно быть конечным числом, получено: {distance}")
         if distance <= 0:
             raise ValueError(f"Расстояние должно быть положительным, получено: {distance}")
     
-    def validate_tariff(self, tariff):
+    @staticmethod
+    def validate_tariff(tariff):
         """
         Проверяет корректность типа тарифа.
         
@@ -93,11 +279,27 @@ class TaxiCalculator:
         Raises:
             ValueError: Если тариф не поддерживается
         """
-        if tariff not in self.TARIFF_RATES:
-            raise ValueError(f"Неподдерживаемый тариф: {tariff}. "
-                           f"Доступные: {list(self.TARIFF_RATES.keys())}")
+        if tariff not in TaxiCalculator.TARIFF_RATES:
+            TaxiCalculator._raise_unknown_tariffs([str(tariff)])
+    
+    @staticmethod
+    def _raise_unknown_tariffs(unknown):
+        """
+        Выбрасывает ошибку о неподдерживаемых тарифах.
+        
+        Сообщение формируется только здесь, вне основного пути расчета.
+        
+        Args:
+            unknown: Названия неподдерживаемых тарифов
+            
+        Raises:
+            ValueError: Всегда
+        """
+        raise ValueError(f"Неподдерживаемый тариф: {', '.join(unknown)}. "
+                         f"Доступные: {list(TaxiCalculator._TARIFF_NAMES)}")
     
-    def validate_rating(self, rating, rating_type="traffic"):
+    @staticmethod
+    def validate_rating(rating, rating_type="traffic"):
         """
         Проверяет корректность рейтинга (1-5).
         
@@ -114,8 +316,26 @@ class TaxiCalculator:
         if not 1 <= rating <= 5:
             raise ValueError(f"Рейтинг {rating_type} должен быть от 1 до 5, получено: {rating}")
     
-    def calculate_fare(self, distance, tariff, traffic_rating=1, 
-                      weather_rating=1, overload_rating=1):
+    @staticmethod
+    def _validate_params(distance, tariff, traffic_rating, weather_rating,
+                         overload_rating):
+        """
+        Полная проверка параметров calculate_fare.
+        
+        Вызывается, только если быстрая проверка не прошла: выбрасывает
+        то же исключение, что и соответствующий validate_*, либо ничего не
+        делает для допустимых подклассов int/float (например, bool).
+        """
+        calc = TaxiCalculator
+        calc.validate_distance(distance)
+        calc.validate_tariff(tariff)
+        calc.validate_rating(traffic_rating, "пробок")
+        calc.validate_rating(weather_rating, "непогоды")
+        calc.validate_rating(overload_rating, "спроса")
+    
+    @staticmethod
+    def calculate_fare(distance, tariff, traffic_rating=1,
+                       weather_rating=1, overload_rating=1):
         """
         Рассчитывает стоимость поездки такси.
         
@@ -140,42 +360,396 @@ class TaxiCalculator:
             >>> calc.calculate_fare(10, 'эконом', traffic_rating=5)
             2000.0
         """
-        # Валидация параметров
-        self.validate_distance(distance)
-        self.validate_tariff(tariff)
-        self.validate_rating(traffic_rating, "пробок")
-        self.validate_rating(weather_rating, "непогоды")
-        self.validate_rating(overload_rating, "спроса")
+        return TaxiCalculator.calculate_fare_cents(
+            distance, tariff, traffic_rating, weather_rating, overload_rating
+        ) / 100
+    
+    @staticmethod
+    def calculate_fare_cents(distance, tariff, traffic_rating=1,
+                             weather_rating=1, overload_rating=1):
+        """
+        Рассчитывает стоимость поездки такси в целых копейках.
         
-        # Расчет базовой стоимости
-        base_rate = self.TARIFF_RATES[tariff]
-        base_fare = distance * base_rate
+        Удобен для суммирования многих поездок (например, выручки за день):
+        сумма целых чисел точна и не накапливает ошибок округления.
         
-        # Применение коэффициентов
-        traffic_multiplier = self.TRAFFIC_MULTIPLIERS[traffic_rating]
-        weather_multiplier = self.WEATHER_MULTIPLIERS[weather_rating]
-        overload_multiplier = self.OVERLOAD_MULTIPLIERS[overload_rating]
+        Args:
+            distance: Расстояние поездки в км
+            tariff: Тип тарифа (эконом, комфорт, комфорт_плюс, бизнес)
+            traffic_rating: Уровень пробок (1-5)
+            weather_rating: Уровень непогоды (1-5)
+            overload_rating: Уровень спроса/переполненности (1-5)
         
-        # Итоговая стоимость
-        total_multiplier = traffic_multiplier * weather_multiplier * overload_multiplier
-        fare = base_fare * total_multiplier
+        Returns:
+            int: Расчетная стоимость поездки в копейках
+            
+        Raises:
+            ValueError: Если параметры некорректны
+            TypeError: Если параметры неправильного типа
+            
+        Examples:
+            >>> calc = TaxiCalculator()
+            >>> calc.calculate_fare_cents(10, 'эконом', weather_rating=3)
+            115000
+        """
+        # Валидация параметров: одна проверка для типичного корректного вызова
+        if not ((type(distance) is int or type(distance) is float)
+                and 0 < distance < math.inf
+                and tariff in TaxiCalculator.TARIFF_RATES
+                and type(traffic_rating) is int and 1 <= traffic_rating <= 5
+                and type(weather_rating) is int and 1 <= weather_rating <= 5
+                and type(overload_rating) is int and 1 <= overload_rating <= 5):
+            TaxiCalculator._validate_params(distance, tariff, traffic_rating,
+                                            weather_rating, overload_rating)
+        
+        return TaxiCalculator._cached_fare_kop(distance, tariff, traffic_rating,
+                                               weather_rating, overload_rating)
+    
+    @staticmethod
+    def calculate_fare_unchecked(distance, tariff, traffic_rating=1,
+                                 weather_rating=1, overload_rating=1):
+        """
+        Рассчитывает стоимость поездки без проверки параметров.
         
-        # Применение минимальной стоимости
-        fare = max(fare, self.MIN_FARE)
+        Предназначен для кода, который уже проверил параметры (например,
+        на границе API сервиса). Вызывающий обязан передавать значения,
+        которые принял бы calculate_fare: для них результат совпадает.
+        Для некорректных параметров результат не определен — возможны
+        KeyError, IndexError или неверная стоимость без ошибки.
         
-        # Округление до копеек
-        fare = round(fare, 2)
+        Args:
+            distance: Расстояние поездки в км (> 0)
+            tariff: Тип тарифа (эконом, комфорт, комфорт_плюс, бизнес)
+            traffic_rating: Уровень пробок (1-5)
+            weather_rating: Уровень непогоды (1-5)
+            overload_rating: Уровень спроса/переполненности (1-5)
+        
+        Returns:
+            float: Расчетная стоимость поездки в рублях
+            
+        Examples:
+            >>> calc = TaxiCalculator()
+            >>> calc.calculate_fare_unchecked(10, 'эконом', traffic_rating=5)
+            2000.0
+        """
+        return TaxiCalculator._cached_fare_kop(
+            distance, tariff, traffic_rating, weather_rating, overload_rating
+        ) / 100
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _cached_fare_kop(distance, tariff, traffic_rating, weather_rating,
+                         overload_rating):
+        """
+        Рассчитывает стоимость в копейках по уже проверенным параметрам.
+        
+        Результаты кэшируются: повторные запросы с теми же параметрами
+        (частый случай для целых расстояний) не пересчитываются.
+        """
+        calc = TaxiCalculator
+        
+        # Расчет стоимости в копейках с учетом коэффициентов и минимума;
+        # int() приводит результат C-расширения к точному целому
+        return int(_fare_kernel(
+            distance,
+            calc._TARIFF_RATES_KOP[tariff],
+            calc._COMBINED[traffic_rating - 1][weather_rating - 1][overload_rating - 1],
+            calc._MIN_FARE_KOP
+        ))
+    
+    def _validate_batch_dtype(self, dtype):
+        """
+        Проверяет тип вычислений пакетного расчета.
+        
+        Args:
+            dtype: Тип вычислений (float64 или float32)
+            
+        Returns:
+            numpy.dtype: Тип вычислений
+            
+        Raises:
+            ValueError: Если тип не поддерживается
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in self._BATCH_LUTS:
+            raise ValueError(f"Тип вычислений должен быть float64 или float32, "
+                             f"получено: {dtype}")
+        return dtype
+    
+    def _validate_distance_array(self, distances, dtype):
+        """
+        Проверяет массив расстояний для пакетного расчета.
+        
+        Args:
+            distances: Расстояние или массив расстояний в км
+            dtype: Тип вычислений (результат _validate_batch_dtype)
+            
+        Returns:
+            numpy.ndarray: Расстояния в виде массива типа dtype (не менее 1-D)
+            
+        Raises:
+            ValueError: Если хотя бы одно расстояние <= 0 или не конечно
+            TypeError: Если расстояния не числа
+        """
+        distances = np.asarray(distances)
+        if distances.dtype.kind not in 'iuf':
+            raise TypeError(f"Расстояние должно быть числом, получено: {distances.dtype}")
+        # Проверка после приведения: в float32 большие расстояния становятся inf
+        with np.errstate(over='ignore'):
+            distances = np.atleast_1d(distances.astype(dtype, copy=False))
+        if not np.isfinite(distances).all():
+            raise ValueError("Расстояние должно быть конечным числом")
+        if not (distances > 0).all():
+            raise ValueError("Расстояние должно быть положительным")
+        return distances
+    
+    def _validate_rating_array(self, ratings, rating_type):
+        """
+        Проверяет массив рейтингов для пакетного расчета.
+        
+        Args:
+            ratings: Рейтинг или массив рейтингов от 1 до 5
+            rating_type: Тип рейтинга (пробок, непогоды, спроса)
+            
+        Returns:
+            numpy.ndarray: Рейтинги в виде целочисленного массива
+            
+        Raises:
+            ValueError: Если хотя бы один рейтинг вне диапазона [1, 5]
+            TypeError: Если рейтинги не целые числа
+        """
+        ratings = np.asarray(ratings)
+        if ratings.dtype.kind not in 'iu':
+            raise TypeError(f"Рейтинг {rating_type} должен быть целым числом, "
+                            f"получено: {ratings.dtype}")
+        if not ((ratings >= 1) & (ratings <= 5)).all():
+            raise ValueError(f"Рейтинг {rating_type} должен быть от 1 до 5")
+        return ratings
+    
+    def _batch_fares(self, distances, tariff_codes, traffic, weather, overload):
+        """
+        Рассчитывает стоимость поездок по проверенным расстояниям и кодам тарифов.
+        
+        Args:
+            distances: Массив расстояний (результат _validate_distance_array);
+                его тип определяет тип вычислений
+            tariff_codes: Массив кодов тарифов (индексы в _TARIFF_KOP_LUT)
+            traffic: Уровни пробок (1-5)
+            weather: Уровни непогоды (1-5)
+            overload: Уровни спроса/переполненности (1-5)
+            
+        Returns:
+            numpy.ndarray: Стоимости поездок в рублях
+        """
+        validate_ratings = self._validate_rating_array
+        traffic = validate_ratings(traffic, "пробок")
+        weather = validate_ratings(weather, "непогоды")
+        overload = validate_ratings(overload, "спроса")
+        
+        # Расчет стоимости для всех поездок сразу
+        tariff_lut, combined_lut = self._BATCH_LUTS[distances.dtype]
+        rates = tariff_lut[tariff_codes]
+        mult = combined_lut[traffic - 1, weather - 1, overload - 1]
+        # Минимум приводится к типу вычислений, чтобы не повышать тип массивов
+        min_kop = distances.dtype.type(self._MIN_FARE_KOP)
+        shape = np.broadcast_shapes(distances.shape, rates.shape, mult.shape)
+        fare_ufunc, fare_batch_parallel = _batch_kernels()
+        if (fare_batch_parallel is not None and len(shape) == 1
+                and shape[0] >= _PARALLEL_MIN_SIZE):
+            fare = np.empty(shape, dtype=distances.dtype)
+            fare_batch_parallel(np.broadcast_to(distances, shape),
+                                np.broadcast_to(rates, shape),
+                                np.broadcast_to(mult, shape),
+                                min_kop, fare)
+        else:
+            fare = fare_ufunc(distances, rates, mult, min_kop)
+        
+        # Перевод копеек в рубли (всегда в float64)
+        fare = fare.astype(np.float64, copy=False)
+        fare /= 100
         
         return fare
     
-    def get_tariff_info(self):
+    def calculate_fare_batch(self, distances, tariffs, traffic=1,
+                             weather=1, overload=1, dtype='float64'):
+        """
+        Рассчитывает стоимость набора поездок за один векторный проход.
+        
+        Все аргументы приводятся к массивам numpy и транслируются
+        (broadcasting) друг к другу, поэтому вместо массива можно передать
+        одно значение, общее для всех поездок.
+        
+        Args:
+            distances: Расстояния поездок в км
+            tariffs: Типы тарифов (эконом, комфорт, комфорт_плюс, бизнес)
+            traffic: Уровни пробок (1-5)
+            weather: Уровни непогоды (1-5)
+            overload: Уровни спроса/переполненности (1-5)
+            dtype: Тип вычислений. 'float64' дает тот же результат, что и
+                calculate_fare; 'float32' быстрее на больших массивах, но
+                может отличаться на 1 копейку (на несколько копеек при
+                стоимости свыше 10 000 руб)
+        
+        Returns:
+            numpy.ndarray: Стоимости поездок в рублях (float64), округленные
+                до копеек
+            
+        Raises:
+            ImportError: Если не установлен numpy
+            ValueError: Если параметры некорректны
+            TypeError: Если параметры неправильного типа
+            
+        Examples:
+            >>> calc = TaxiCalculator()
+            >>> calc.calculate_fare_batch([10, 0.1], ['эконом', 'бизнес'])
+            array([1000.,   50.])
+        """
+        if np is None:
+            raise ImportError("Для пакетного расчета требуется numpy")
+        
+        dtype = self._validate_batch_dtype(dtype)
+        distances = self._validate_distance_array(distances, dtype)
+        
+        # Перевод названий тарифов в коды: словарь опрашивается только
+        # для различающихся названий, а не для каждой поездки
+        tariff_codes_map = self._TARIFF_CODES
+        tariffs = np.asarray(tariffs)
+        if tariffs.dtype.kind != 'U':
+            # Нестроковые значения (например, None) сравниваются как строки,
+            # иначе сортировка в np.unique падает до проверки тарифов
+            tariffs = tariffs.astype(str)
+        names, inverse = np.unique(tariffs, return_inverse=True)
+        unknown = [str(name) for name in names if name not in tariff_codes_map]
+        if unknown:
+            self._raise_unknown_tariffs(unknown)
+        codes = np.array([tariff_codes_map[name] for name in names], dtype=np.intp)
+        tariff_codes = codes[inverse].reshape(tariffs.shape)
+        
+        return self._batch_fares(distances, tariff_codes, traffic, weather, overload)
+    
+    def calculate_fare_df(self, df, dtype='float64'):
+        """
+        Рассчитывает стоимость поездок, заданных строками DataFrame.
+        
+        Расчет ведется по столбцам целиком, без обхода строк, поэтому
+        заменяет df.apply(..., axis=1) с calculate_fare.
+        
+        Args:
+            df: pandas.DataFrame со столбцами 'distance', 'tariff',
+                'traffic', 'weather', 'overload'
+            dtype: Тип вычислений, как в calculate_fare_batch
+        
+        Returns:
+            pandas.Series: Стоимости поездок в рублях с индексом df
+            
+        Raises:
+            ImportError: Если не установлен pandas
+            KeyError: Если в df нет нужного столбца
+            ValueError: Если параметры некорректны
+            TypeError: Если параметры неправильного типа
+            
+        Examples:
+            >>> calc = TaxiCalculator()
+            >>> df = pd.DataFrame({'distance': [10, 0.1],
+            ...                    'tariff': ['эконом', 'бизнес'],
+            ...                    'traffic': [5, 1], 'weather': [1, 1],
+            ...                    'overload': [1, 1]})
+            >>> calc.calculate_fare_df(df).tolist()
+            [2000.0, 50.0]
+        """
+        # pandas импортируется только здесь: его загрузка заметно
+        # замедлила бы импорт модуля для остальных методов
+        try:
+            import pandas as pd
+        except ImportError:  # pragma: no cover - pandas нужен только для этого метода
+            raise ImportError("Для расчета по DataFrame требуется pandas") from None
+        
+        dtype = self._validate_batch_dtype(dtype)
+        distances = self._validate_distance_array(df['distance'].to_numpy(), dtype)
+        
+        # Перевод названий тарифов в коды через категории: словарь
+        # опрашивается только для различающихся названий
+        tariff_codes_map = self._TARIFF_CODES
+        # Объявленные, но не встречающиеся в данных категории не проверяются
+        tariffs = pd.Categorical(df['tariff']).remove_unused_categories()
+        unknown = [str(name) for name in tariffs.categories
+                   if name not in tariff_codes_map]
+        if (tariffs.codes < 0).any():
+            unknown.append('nan')
+        if unknown:
+            self._raise_unknown_tariffs(unknown)
+        codes = np.array([tariff_codes_map[name] for name in tariffs.categories],
+                         dtype=np.intp)
+        tariff_codes = codes[tariffs.codes]
+        
+        fares = self._batch_fares(
+            distances,
+            tariff_codes,
+            df['traffic'].to_numpy(),
+            df['weather'].to_numpy(),
+            df['overload'].to_numpy()
+        )
+        
+        return pd.Series(fares, index=df.index, name='fare')
+    
+    def get_pricer(self, tariff):
+        """
+        Возвращает функцию расчета стоимости для одного тарифа.
+        
+        Функция генерируется при первом запросе тарифа: ставка и минимальная
+        стоимость встраиваются в ее код как константы, поэтому при вызове
+        не нужен поиск тарифа в словаре. Результат совпадает с
+        calculate_fare, параметры проверяются так же.
+        
+        Args:
+            tariff: Тип тарифа (эконом, комфорт, комфорт_плюс, бизнес)
+        
+        Returns:
+            callable: Функция pricer(distance, traffic_rating=1,
+                weather_rating=1, overload_rating=1), возвращающая
+                стоимость поездки в рублях
+            
+        Raises:
+            ValueError: Если тариф не поддерживается
+            
+        Examples:
+            >>> calc = TaxiCalculator()
+            >>> econom = calc.get_pricer('эконом')
+            >>> econom(10, traffic_rating=5)
+            2000.0
+        """
+        pricer = self._PRICERS.get(tariff)
+        if pricer is None:
+            self.validate_tariff(tariff)
+            # Дальше используется собственная строка класса, а не объект
+            # вызывающего (например, подкласс str с переопределенными методами)
+            tariff = self._TARIFF_NAMES[self._TARIFF_CODES[tariff]]
+            source = _PRICER_TEMPLATE.format(
+                rate_kop=self._TARIFF_RATES_KOP[tariff],
+                min_kop=self._MIN_FARE_KOP,
+            )
+            namespace = {
+                'validate': self._validate_params,
+                'combined': self._COMBINED,
+                'inf': math.inf,
+                'tariff': tariff,
+            }
+            exec(compile(source, f"<pricer {tariff}>", 'exec'), namespace)
+            pricer = self._PRICERS[tariff] = namespace['pricer']
+        return pricer
+    
+    @staticmethod
+    def get_tariff_info():
         """
         Возвращает информацию о доступных тарифах.
         
+        Информация вычисляется один раз при создании класса; каждый вызов
+        возвращает один и тот же объект, доступный только для чтения.
+        
         Returns:
-            dict: Информация о тарифах с ключами:
-                - 'тарифы': список доступных тарифов
-                - 'ставки': словарь ставок по тарифам
+            types.MappingProxyType: Информация о тарифах с ключами:
+                - 'тарифы': кортеж доступных тарифов
+                - 'ставки': ставки по тарифам (только для чтения)
                 - 'минимальная_стоимость': минимальная цена поездки
                 
         Examples:
@@ -184,11 +758,7 @@ class TaxiCalculator:
             >>> info['ставки']['эконом']
             100
         """
-        return {
-            'тарифы': list(self.TARIFF_RATES.keys()),
-            'ставки': self.TARIFF_RATES,
-            'минимальная_стоимость': self.MIN_FARE
-        }
+        return TaxiCalculator._TARIFF_INFO
 
 
 def main():
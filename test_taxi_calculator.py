@@ -11,9 +11,22 @@ Unit-тесты для модуля расчета стоимости тариф
     coverage html
 """
 
+import os
+import subprocess
+import sys
 import unittest
 from taxi_calculator import TaxiCalculator
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 
 class TestTaxiCalculatorValidation(unittest.TestCase):
     """Тесты для проверки валидации входных параметров."""
@@ -40,6 +53,14 @@ class TestTaxiCalculatorValidation(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.calc.validate_distance(0)
     
+    def test_validate_distance_not_finite(self):
+        """Проверка: бесконечное расстояние и nan вызывают ValueError."""
+        for distance in (float('inf'), float('nan')):
+            with self.assertRaises(ValueError):
+                self.calc.validate_distance(distance)
+            with self.assertRaises(ValueError):
+                self.calc.calculate_fare(distance, 'эконом')
+    
     def test_validate_distance_wrong_type(self):
         """Проверка: строка вместо числа вызывает TypeError."""
         with self.assertRaises(TypeError):
@@ -86,6 +107,18 @@ class TestTaxiCalculatorValidation(unittest.TestCase):
         """Проверка: дробное число вызывает TypeError."""
         with self.assertRaises(TypeError):
             self.calc.validate_rating(3.5)
+    
+    def test_calculate_fare_rating_error_names_factor(self):
+        """Проверка: ошибка рейтинга в calculate_fare указывает фактор."""
+        with self.assertRaisesRegex(ValueError, "непогоды"):
+            self.calc.calculate_fare(10, 'эконом', weather_rating=6)
+    
+    def test_calculate_fare_accepts_number_subclasses(self):
+        """Проверка: подклассы int/float проходят валидацию, как и раньше."""
+        class Km(float):
+            pass
+        fare = self.calc.calculate_fare(Km(10), 'эконом', traffic_rating=True)
+        self.assertEqual(fare, 1000.0)
 
 
 class TestTaxiCalculatorFareCalculation(unittest.TestCase):
@@ -184,6 +217,110 @@ class TestTaxiCalculatorFareCalculation(unittest.TestCase):
         )
         # fare должна быть округлена до сотых
         self.assertEqual(fare, round(fare, 2))
+    
+    def test_fare_half_kopeck_rounds_up(self):
+        """Проверка: половина копейки округляется вверх."""
+        # 0.5 км * 100 * 1.25 * 1.25 = 78.125 руб
+        fare = self.calc.calculate_fare(
+            distance=0.5,
+            tariff='эконом',
+            traffic_rating=3,
+            overload_rating=3
+        )
+        self.assertEqual(fare, 78.13)
+    
+    def test_unchecked_matches_calculate_fare(self):
+        """Проверка: расчет без валидации совпадает с обычным."""
+        for args in [(10, 'эконом'), (0.1, 'бизнес'), (12, 'бизнес', 4, 5, 4),
+                     (3.33, 'комфорт', 1, 3, 1)]:
+            self.assertEqual(self.calc.calculate_fare_unchecked(*args),
+                             self.calc.calculate_fare(*args))
+    
+    def test_fare_cents_is_integer_kopecks(self):
+        """Проверка: стоимость в копейках — целое число, равное рублевой * 100."""
+        cents = self.calc.calculate_fare_cents(10, 'эконом', 4, 3, 2)
+        self.assertIsInstance(cents, int)
+        self.assertEqual(cents, 189750)
+        self.assertEqual(cents / 100, self.calc.calculate_fare(10, 'эконом', 4, 3, 2))
+    
+    def test_fare_cents_sum_is_exact(self):
+        """Проверка: сумма стоимостей в копейках не накапливает погрешность."""
+        total = sum(self.calc.calculate_fare_cents(0.77, 'эконом') for _ in range(1000))
+        self.assertEqual(total, 1000 * 7700)
+    
+    def test_fare_cents_huge_distance(self):
+        """Проверка: стоимость больше диапазона int64 рассчитывается точно."""
+        self.assertEqual(self.calc.calculate_fare_cents(1e14, 'бизнес', 5, 5, 5),
+                         18 * 10 ** 18)
+    
+    def test_fare_cents_validates_parameters(self):
+        """Проверка: расчет в копейках проверяет параметры."""
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_cents(0, 'эконом')
+    
+    def test_repeat_quote_uses_cache(self):
+        """Проверка: повторный расчет с теми же параметрами берется из кэша."""
+        first = self.calc.calculate_fare(7, 'комфорт', 2, 4, 3)
+        hits = TaxiCalculator._cached_fare_kop.cache_info().hits
+        second = self.calc.calculate_fare(7, 'комфорт', 2, 4, 3)
+        self.assertEqual(first, second)
+        self.assertEqual(TaxiCalculator._cached_fare_kop.cache_info().hits, hits + 1)
+
+
+class TestTaxiCalculatorPricer(unittest.TestCase):
+    """Тесты для функций расчета по одному тарифу."""
+    
+    def setUp(self):
+        """Подготовка к каждому тесту."""
+        self.calc = TaxiCalculator()
+    
+    def test_pricer_matches_calculate_fare(self):
+        """Проверка: функция тарифа считает так же, как calculate_fare."""
+        pricer = self.calc.get_pricer('комфорт_плюс')
+        for args in [(15, 3, 2, 3), (0.1, 1, 1, 1), (1, 5, 5, 5), (3.33, 2, 4, 1)]:
+            expected = self.calc.calculate_fare(args[0], 'комфорт_плюс', *args[1:])
+            self.assertEqual(pricer(*args), expected)
+    
+    def test_pricer_is_cached(self):
+        """Проверка: повторный запрос тарифа возвращает ту же функцию."""
+        self.assertIs(self.calc.get_pricer('эконом'), self.calc.get_pricer('эконом'))
+    
+    def test_pricer_invalid_tariff(self):
+        """Проверка: неподдерживаемый тариф вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            self.calc.get_pricer('премиум')
+    
+    def test_pricer_validates_parameters(self):
+        """Проверка: функция тарифа проверяет расстояние и рейтинги."""
+        pricer = self.calc.get_pricer('бизнес')
+        with self.assertRaises(ValueError):
+            pricer(-1)
+        with self.assertRaises(ValueError):
+            pricer(10, traffic_rating=0)
+    
+    def test_pricer_ignores_str_subclass_repr(self):
+        """Проверка: код функции тарифа не строится из объекта вызывающего."""
+        calls = []
+        
+        class Tariff(str):
+            def __repr__(self):
+                calls.append(self)
+                return "calls.append(1) or 'эконом'"
+        
+        self.calc._PRICERS.clear()
+        pricer = self.calc.get_pricer(Tariff('эконом'))
+        with self.assertRaises(ValueError):
+            pricer(-1)
+        self.assertEqual(calls, [])
+        self.assertIs(self.calc.get_pricer('эконом'), pricer)
+        self.assertIs(type(next(iter(self.calc._PRICERS))), str)
+    
+    def test_pricer_rejects_infinite_distance(self):
+        """Проверка: бесконечное расстояние вызывает ValueError, а не OverflowError."""
+        pricer = self.calc.get_pricer('эконом')
+        for distance in (float('inf'), float('nan')):
+            with self.assertRaises(ValueError):
+                pricer(distance)
 
 
 class TestTaxiCalculatorEdgeCases(unittest.TestCase):
@@ -257,6 +394,30 @@ class TestTaxiCalculatorInfo(unittest.TestCase):
         self.assertEqual(rates['комфорт'], 150)
         self.assertEqual(rates['комфорт_плюс'], 200)
         self.assertEqual(rates['бизнес'], 300)
+    
+    def test_tariff_info_is_shared_and_read_only(self):
+        """Проверка: информация о тарифах не создается заново и не изменяется."""
+        info = self.calc.get_tariff_info()
+        self.assertIs(info, TaxiCalculator().get_tariff_info())
+        with self.assertRaises(TypeError):
+            info['ставки']['эконом'] = 1
+    
+    def test_tariff_names_are_interned(self):
+        """Проверка: названия тарифов совпадают с интернированными строками."""
+        for tariff in self.calc.get_tariff_info()['тарифы']:
+            self.assertIs(sys.intern(''.join(list(tariff))), tariff)
+    
+    def test_static_methods_without_instance(self):
+        """Проверка: расчет и справка доступны без создания экземпляра."""
+        self.assertEqual(TaxiCalculator.calculate_fare(10, 'эконом'), 1000.0)
+        self.assertEqual(TaxiCalculator.calculate_fare_cents(10, 'эконом'), 100000)
+        self.assertIs(TaxiCalculator.get_tariff_info(), self.calc.get_tariff_info())
+        with self.assertRaises(ValueError):
+            TaxiCalculator.validate_rating(0)
+    
+    def test_calculator_has_no_instance_dict(self):
+        """Проверка: экземпляр калькулятора не хранит собственных атрибутов."""
+        self.assertFalse(hasattr(self.calc, '__dict__'))
 
 
 class TestTaxiCalculatorIntegration(unittest.TestCase):
@@ -306,6 +467,186 @@ class TestTaxiCalculatorIntegration(unittest.TestCase):
         # 15 * 200 * 1.25 * 1.05 * 1.25 = 4921.875
         expected = 15 * 200 * 1.25 * 1.05 * 1.25
         self.assertAlmostEqual(fare, round(expected, 2), places=2)
+    
+    def test_scalar_fare_does_not_load_numba_or_pandas(self):
+        """Сценарий: поштучный расчет не загружает numba и pandas."""
+        code = ("import sys; from taxi_calculator import TaxiCalculator; "
+                "TaxiCalculator.calculate_fare(10, 'эконом'); "
+                "print('numba' in sys.modules, 'pandas' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ['False', 'False'])
+
+
+@unittest.skipIf(np is None, "numpy не установлен")
+class TestTaxiCalculatorBatch(unittest.TestCase):
+    """Тесты для пакетного расчета стоимости."""
+    
+    def setUp(self):
+        """Подготовка к каждому тесту."""
+        self.calc = TaxiCalculator()
+    
+    def test_batch_matches_scalar(self):
+        """Проверка: пакетный расчет совпадает с поштучным."""
+        distances = [10, 0.1, 5, 3.33, 12, 15]
+        tariffs = ['эконом', 'бизнес', 'комфорт', 'комфорт', 'бизнес', 'комфорт_плюс']
+        traffic = [4, 1, 1, 1, 4, 3]
+        weather = [3, 1, 3, 3, 5, 2]
+        overload = [2, 1, 1, 1, 4, 3]
+        fares = self.calc.calculate_fare_batch(
+            distances, tariffs, traffic, weather, overload
+        )
+        for i, fare in enumerate(fares):
+            expected = self.calc.calculate_fare(
+                distances[i], tariffs[i], traffic[i], weather[i], overload[i]
+            )
+            self.assertAlmostEqual(fare, expected, places=2)
+    
+    def test_batch_half_kopeck_rounds_up(self):
+        """Проверка: округление в пакетном расчете такое же, как в поштучном."""
+        fares = self.calc.calculate_fare_batch([0.5], 'эконом', traffic=3, overload=3)
+        self.assertEqual(fares.tolist(), [78.13])
+    
+    def test_large_batch_matches_small_batches(self):
+        """Проверка: большой пакет (многопоточный расчет) считается так же."""
+        distances = np.tile([10, 0.1, 5, 3.33, 12, 15, 0.5, 145.3], 500)
+        tariffs = np.tile(['эконом', 'бизнес', 'комфорт', 'комфорт'], 1000)
+        traffic = np.tile([1, 2, 3, 4, 5], 800)
+        for dtype in ('float64', 'float32'):
+            fares = self.calc.calculate_fare_batch(distances, tariffs, traffic,
+                                                   dtype=dtype)
+            parts = [
+                self.calc.calculate_fare_batch(distances[i:i + 100], tariffs[i:i + 100],
+                                               traffic[i:i + 100], dtype=dtype)
+                for i in range(0, len(distances), 100)
+            ]
+            self.assertEqual(fares.tolist(), np.concatenate(parts).tolist())
+    
+    def test_batch_broadcast_scalars(self):
+        """Проверка: одно значение параметра применяется ко всем поездкам."""
+        fares = self.calc.calculate_fare_batch([10, 20], 'эконом', traffic=5)
+        self.assertEqual(fares.tolist(), [2000.0, 4000.0])
+    
+    def test_batch_minimum_fare(self):
+        """Проверка: применение минимальной стоимости в пакетном расчете."""
+        fares = self.calc.calculate_fare_batch([0.001, 0.1], ['бизнес', 'эконом'])
+        self.assertEqual(fares.tolist(), [50.0, 50.0])
+    
+    def test_batch_float32_within_kopeck(self):
+        """Проверка: расчет в float32 отличается не более чем на копейку."""
+        distances = [10, 0.1, 5, 3.33, 12, 15]
+        tariffs = ['эконом', 'бизнес', 'комфорт', 'комфорт', 'бизнес', 'комфорт_плюс']
+        exact = self.calc.calculate_fare_batch(distances, tariffs, traffic=3, weather=2)
+        fast = self.calc.calculate_fare_batch(distances, tariffs, traffic=3, weather=2,
+                                              dtype='float32')
+        self.assertEqual(fast.dtype, np.float64)
+        self.assertLessEqual(np.abs(exact - fast).max(), 0.01 + 1e-9)
+    
+    def test_batch_float32_computes_in_float32(self):
+        """Проверка: при dtype='float32' вычисления действительно идут в float32."""
+        mult = np.float32(self.calc._COMBINED[2][1][0])
+        kop32 = np.floor(np.float32(1234.567) * np.float32(15000) * mult + np.float32(0.5))
+        fast = self.calc.calculate_fare_batch([1234.567], 'комфорт', traffic=3, weather=2,
+                                              dtype='float32')
+        exact = self.calc.calculate_fare_batch([1234.567], 'комфорт', traffic=3, weather=2)
+        self.assertEqual(fast.tolist(), [float(kop32) / 100])
+        self.assertNotEqual(fast.tolist(), exact.tolist())
+    
+    def test_batch_invalid_dtype(self):
+        """Проверка: неподдерживаемый тип вычислений вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_batch([10], 'эконом', dtype='int32')
+    
+    def test_batch_invalid_distance(self):
+        """Проверка: неположительное расстояние вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_batch([10, 0], 'эконом')
+    
+    def test_batch_not_finite_distance(self):
+        """Проверка: бесконечное расстояние и nan вызывают ValueError."""
+        for distance in (float('inf'), float('nan')):
+            with self.assertRaises(ValueError):
+                self.calc.calculate_fare_batch([1e15, distance], 'бизнес')
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_batch([1e39], 'эконом', dtype='float32')
+    
+    def test_batch_huge_distance(self):
+        """Проверка: стоимость больше диапазона int64 не переполняется."""
+        for size in (1, 4000):
+            fares = self.calc.calculate_fare_batch([1e14] * size, 'бизнес', 5, 5, 5)
+            self.assertTrue((fares == 1.8e17).all())
+    
+    def test_batch_invalid_tariff(self):
+        """Проверка: неподдерживаемый тариф вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_batch([10, 5], ['эконом', 'премиум'])
+    
+    def test_batch_non_string_tariff(self):
+        """Проверка: нестроковый тариф вызывает ValueError о тарифе."""
+        with self.assertRaisesRegex(ValueError, "Неподдерживаемый тариф: None"):
+            self.calc.calculate_fare_batch([10, 5], ['эконом', None])
+    
+    def test_batch_invalid_rating(self):
+        """Проверка: рейтинг вне диапазона вызывает ValueError."""
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_batch([10, 5], 'эконом', weather=[1, 6])
+    
+    def test_batch_rating_not_integer(self):
+        """Проверка: дробный рейтинг вызывает TypeError."""
+        with self.assertRaises(TypeError):
+            self.calc.calculate_fare_batch([10], 'эконом', overload=[2.5])
+
+
+@unittest.skipIf(pd is None, "pandas не установлен")
+class TestTaxiCalculatorDataFrame(unittest.TestCase):
+    """Тесты для расчета стоимости по DataFrame."""
+    
+    def setUp(self):
+        """Подготовка к каждому тесту."""
+        self.calc = TaxiCalculator()
+        self.df = pd.DataFrame({
+            'distance': [10, 0.1, 15],
+            'tariff': ['эконом', 'бизнес', 'комфорт_плюс'],
+            'traffic': [4, 1, 3],
+            'weather': [3, 1, 2],
+            'overload': [2, 1, 3],
+        }, index=[10, 20, 30])
+    
+    def test_df_matches_scalar(self):
+        """Проверка: расчет по DataFrame совпадает с поштучным."""
+        fares = self.calc.calculate_fare_df(self.df)
+        for index, row in self.df.iterrows():
+            expected = self.calc.calculate_fare(
+                row['distance'], row['tariff'],
+                int(row['traffic']), int(row['weather']), int(row['overload'])
+            )
+            self.assertEqual(fares[index], expected)
+    
+    def test_df_keeps_index(self):
+        """Проверка: результат имеет индекс исходного DataFrame."""
+        fares = self.calc.calculate_fare_df(self.df)
+        self.assertEqual(fares.index.tolist(), [10, 20, 30])
+    
+    def test_df_invalid_tariff(self):
+        """Проверка: неподдерживаемый тариф вызывает ValueError."""
+        self.df.loc[20, 'tariff'] = 'премиум'
+        with self.assertRaisesRegex(ValueError, 'премиум'):
+            self.calc.calculate_fare_df(self.df)
+    
+    def test_df_unused_category(self):
+        """Проверка: неиспользуемая категория тарифа не считается ошибкой."""
+        self.df['tariff'] = pd.Categorical(
+            self.df['tariff'], categories=['эконом', 'бизнес', 'комфорт_плюс', 'премиум']
+        )
+        fares = self.calc.calculate_fare_df(self.df)
+        self.assertEqual(fares[10], self.calc.calculate_fare(10, 'эконом', 4, 3, 2))
+    
+    def test_df_invalid_rating(self):
+        """Проверка: рейтинг вне диапазона вызывает ValueError."""
+        self.df.loc[30, 'overload'] = 7
+        with self.assertRaises(ValueError):
+            self.calc.calculate_fare_df(self.df)
 
 
 if __name__ == '__main__':